@@ -5,38 +5,103 @@ crypto_price_tracker.py
 Terminal crypto price tracker with:
 - symbol -> CoinGecko ID mapping (pass LTC, DOGE, SOL, etc. or full CoinGecko ids)
 - configurable coins & refresh interval via CLI
+- multiple quote currencies fetched in a single request (--vs usd,eur)
 - CSV logging of historical prices (append mode)
 - percent change since previous poll
 - graceful handling of network errors and Ctrl+C
-- colorized terminal output (colorama)
+- colorized terminal output (ANSI escape codes)
 
 Usage examples:
   python crypto_price_tracker.py
   python crypto_price_tracker.py --coins LTC,DOGE,SOL --once
   python crypto_price_tracker.py --coins bitcoin,ethereum --interval 60 --csv prices.csv
   python crypto_price_tracker.py --coins ltc,doge,sol --no-csv --no-color
+  python crypto_price_tracker.py --coins BTC,ETH --vs usd,eur,btc
 """
 from __future__ import annotations
 import argparse
 import csv
+import math
 import os
+import signal
+import stat
 import sys
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+import types
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Mapping, Optional, TextIO, Tuple
 
 import requests
-from colorama import Fore, Style, init
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson as _json  # much faster JSON decoding when available
+except ImportError:  # fall back to the standard library
+    import json as _json
+
+
+class Fore:
+    """ANSI foreground colors (plain constants, no stream wrapper)."""
+    RED = "\x1b[31m"
+    GREEN = "\x1b[32m"
+    YELLOW = "\x1b[33m"
+    MAGENTA = "\x1b[35m"
+    CYAN = "\x1b[36m"
+
+
+class Style:
+    BRIGHT = "\x1b[1m"
+    RESET_ALL = "\x1b[0m"
+
+
+def enable_windows_ansi() -> None:
+    """Turn on VT escape processing for the Windows console (no-op elsewhere)."""
+    if os.name != "nt":
+        return
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except Exception:
+        pass
 
-init(autoreset=True)
 
 # Default configuration
 DEFAULT_COINS = ["bitcoin", "ethereum", "dogecoin", "solana", "litecoin"]
+DEFAULT_VS = ["usd"]
 DEFAULT_INTERVAL = 30  # seconds
 DEFAULT_TIMEOUT = 10  # seconds
 DEFAULT_CSV = "crypto_prices.csv"
+BATCH_SIZE = 50  # max coin ids per CoinGecko request
+MAX_CONCURRENT_REQUESTS = 10
+CSV_FLUSH_EVERY = 10  # rows buffered before flushing the CSV file
+WAIT_SLICE = 1.0  # seconds; max wait between checks so Ctrl+C is handled promptly (also on Windows)
+
+# Static table layout (identical every poll, so built once)
+SEPARATOR = "--------------------------------------------------------------"
+NAME_WIDTH = 12
+ROW_FORMAT = "{name}{price:>16}{pct:>14}"  # name is pre-padded to NAME_WIDTH by the caller
+
+# Price prefixes for common quote currencies; others are shown as e.g. "CAD 1.2345"
+CURRENCY_SYMBOLS: Mapping[str, str] = types.MappingProxyType({
+    "usd": "$",
+    "eur": "€",
+    "gbp": "£",
+    "jpy": "¥",
+})
+
+# Crypto quote currencies supported by CoinGecko; prices in these need 8 decimals to be readable
+# ("bits"/"sats" are small BTC units with large values, so they keep the fiat precision)
+CRYPTO_QUOTES = frozenset({"btc", "eth", "ltc", "bch", "bnb", "eos", "xrp", "xlm", "link", "dot", "yfi", "sol"})
 
 # Common symbol -> CoinGecko id map (case-insensitive)
-SYMBOL_TO_ID: Dict[str, str] = {
+SYMBOL_TO_ID: Mapping[str, str] = types.MappingProxyType({
     "BTC": "bitcoin",
     "ETH": "ethereum",
     "LTC": "litecoin",
@@ -56,12 +121,38 @@ SYMBOL_TO_ID: Dict[str, str] = {
     "TRX": "tron",
     "UNI": "uniswap",
     # add more mappings as desired
-}
+})
+
+# Case-folded lookup table built once, so resolving a token needs a single normalization
+_SYMBOL_TO_ID_CI: Dict[str, str] = {k.casefold(): v for k, v in SYMBOL_TO_ID.items()}
+
+
+def _make_session() -> requests.Session:
+    """Create a pooled session so polls reuse the keep-alive connection instead of a new TCP+TLS handshake."""
+    session = requests.Session()
+    # Retry-After is ignored so a rate-limited poll fails fast; the poll loop's own schedule does the backing off
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENT_REQUESTS, max_retries=retries)
+    session.mount("https://", adapter)
+    session.headers.update({"Accept-Encoding": "gzip"})
+    return session
+
 
+_SESSION = _make_session()
 
-def build_url(coins: List[str]) -> str:
+# url -> (ETag, Last-Modified, parsed body) for conditional GETs; a 304 reuses the parsed body
+_RESPONSE_CACHE: Dict[str, Tuple[Optional[str], Optional[str], Dict[str, Dict[str, float]]]] = {}
+
+
+def build_url(coins: List[str], vs: List[str]) -> str:
     ids = ",".join(coins)
-    return f"https://api.coingecko.com/api/v3/simple/price?ids={ids}&vs_currencies=usd"
+    vs_currencies = ",".join(vs)
+    return f"https://api.coingecko.com/api/v3/simple/price?ids={ids}&vs_currencies={vs_currencies}"
 
 
 def resolve_input_coins(raw: str) -> Tuple[List[str], Dict[str, str]]:
@@ -76,12 +167,8 @@ def resolve_input_coins(raw: str) -> Tuple[List[str], Dict[str, str]]:
     seen = set()
 
     for t in tokens:
-        up = t.upper()
-        if up in SYMBOL_TO_ID:
-            cid = SYMBOL_TO_ID[up]
-        else:
-            # assume user provided a CoinGecko id (e.g., "bitcoin" or "solana") — normalize to lower-case
-            cid = t.lower()
+        # unknown symbols are assumed to be CoinGecko ids (e.g., "bitcoin" or "solana") — normalize to lower-case
+        cid = _SYMBOL_TO_ID_CI.get(t.casefold()) or t.lower()
         # avoid duplicates
         if cid not in seen:
             resolved.append(cid)
@@ -91,88 +178,175 @@ def resolve_input_coins(raw: str) -> Tuple[List[str], Dict[str, str]]:
     return resolved, mapping
 
 
-def fetch_prices(coins: List[str], timeout: int = DEFAULT_TIMEOUT) -> Dict[str, Dict[str, float]]:
-    """Fetch prices from CoinGecko. Raises requests.RequestException on network errors."""
-    url = build_url(coins)
-    resp = requests.get(url, timeout=timeout)
+def resolve_vs_currencies(raw: str) -> List[str]:
+    """Parse a comma-separated list of quote currencies (e.g. "usd,EUR") into unique lower-case codes."""
+    resolved: List[str] = []
+    for t in raw.split(","):
+        code = t.strip().lower()
+        if code and code not in resolved:
+            resolved.append(code)
+    return resolved
+
+
+def build_header(vs: List[str]) -> str:
+    """Table header; the price column names the currency when there is only one."""
+    if len(vs) == 1:
+        return ROW_FORMAT.format(name="Crypto".ljust(NAME_WIDTH), price=f"Price ({vs[0].upper()})", pct="Change")
+    return ROW_FORMAT.format(name="Crypto".ljust(NAME_WIDTH), price="Price", pct="Change")
+
+
+def price_format(vs: str) -> str:
+    """Format string for a price quoted in `vs`: currency prefix plus 4 decimals (8 for crypto quotes)."""
+    prefix = CURRENCY_SYMBOLS.get(vs, vs.upper() + " ").replace("{", "{{").replace("}", "}}")
+    decimals = 8 if vs in CRYPTO_QUOTES else 4
+    return prefix + "{:,.%df}" % decimals
+
+
+def chunk_coins(coins: List[str], size: int = BATCH_SIZE) -> List[List[str]]:
+    """Split coins into batches of at most `size` ids (one request per batch)."""
+    return [coins[i:i + size] for i in range(0, len(coins), size)]
+
+
+def build_batch_urls(coins: List[str], vs: List[str]) -> List[str]:
+    """
+    Build one request URL per batch; the coin list is fixed after startup, so callers compute this once.
+    Every batch asks for all quote currencies, so adding a currency never adds a request.
+    """
+    return [build_url(batch, vs) for batch in chunk_coins(coins)]
+
+
+def fetch_batch(url: str, timeout: int = DEFAULT_TIMEOUT) -> Dict[str, Dict[str, float]]:
+    """
+    Fetch prices for a single batch URL. Raises requests.RequestException on network errors.
+    Sends If-None-Match/If-Modified-Since from the previous response, so an unchanged payload
+    comes back as an empty 304 and the previously parsed data is returned.
+    """
+    headers: Dict[str, str] = {}
+    cached = _RESPONSE_CACHE.get(url)
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    resp = _SESSION.get(url, timeout=timeout, headers=headers)
+    if resp.status_code == 304 and cached is not None:
+        return cached[2]
     resp.raise_for_status()
-    return resp.json()
+    data = _json.loads(resp.content)
 
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        _RESPONSE_CACHE[url] = (etag, last_modified, data)
+    return data
 
-def ensure_csv_header(path: str, coins: List[str]) -> None:
-    if not path:
-        return
-    if not os.path.exists(path):
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            header = ["timestamp"] + [f"{c}_usd" for c in coins]
-            writer.writerow(header)
 
+def fetch_prices(urls: List[str], timeout: int = DEFAULT_TIMEOUT) -> Dict[str, Dict[str, float]]:
+    """
+    Fetch prices from CoinGecko for the batch URLs from build_batch_urls().
+    Raises requests.RequestException on network errors.
+    Multiple batches are requested concurrently and merged.
+    """
+    if len(urls) == 1:
+        return fetch_batch(urls[0], timeout=timeout)
 
-def append_prices_to_csv(path: str, coins: List[str], prices: Dict[str, Optional[float]]) -> None:
-    if not path:
-        return
-    with open(path, "a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        row = [time.strftime("%Y-%m-%d %H:%M:%S")] + [prices.get(c, "") for c in coins]
-        writer.writerow(row)
+    data: Dict[str, Dict[str, float]] = {}
+    with ThreadPoolExecutor(max_workers=min(len(urls), MAX_CONCURRENT_REQUESTS)) as pool:
+        for result in pool.map(lambda u: fetch_batch(u, timeout=timeout), urls):
+            data.update(result)
+    return data
 
 
-def format_price(price: Optional[float]) -> str:
-    if price is None:
-        return "N/A"
-    return f"${price:,.4f}"
+def open_csv_log(path: str, pairs: List[Tuple[str, str]]) -> TextIO:
+    """
+    Open the CSV log for appending and return the handle (kept open for the whole run).
+    A new/empty regular file gets the header row first. Non-regular targets (FIFOs, /dev/stdout) are
+    opened as-is. The file is opened O_APPEND and the kernel is told access is sequential, where supported.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        st = os.fstat(fd)
+        is_regular = stat.S_ISREG(st.st_mode)
+        if is_regular and hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass  # only a hint
+        f = os.fdopen(fd, "a", buffering=8192, newline="", encoding="utf-8")
+    except BaseException:
+        os.close(fd)
+        raise
+    is_new = is_regular and st.st_size == 0
+    if is_new:
+        writer = csv.writer(f)
+        header = ["timestamp"] + [f"{c}_{vs}" for c, vs in pairs]
+        writer.writerow(header)
+    return f
 
 
-def format_pct(delta: Optional[float]) -> str:
-    if delta is None:
-        return "   N/A   "
-    sign = "+" if delta >= 0 else ""
-    return f"{sign}{delta * 100:7.2f}%"
+def append_prices_to_csv(f, prices: List[float], now_str: str) -> None:
+    """
+    Append one row to the already-open CSV file (the file stays open for the whole run).
+    `prices` is aligned to the CSV header's (coin, currency) order; NaN (missing) is written as an empty field.
+    The fields are a timestamp and plain floats that never need quoting, so the line is built directly
+    (same float repr and line ending as csv.writer) instead of going through the csv module.
+    """
+    f.write(now_str + "," + ",".join("" if math.isnan(p) else repr(p) for p in prices) + "\r\n")
 
 
 def print_prices(
-    coins: List[str],
+    pairs: List[Tuple[str, str]],
+    names: List[str],
+    price_formats: List[str],
     data: Dict[str, Dict[str, float]],
-    prev: Dict[str, float],
-) -> Dict[str, Optional[float]]:
-    """Print table and return current prices dict to be used as previous next poll."""
-    print("--------------------------------------------------------------")
-    print(f"{'Crypto':<12}{'Price (USD)':>16}{'Change':>14}")
-    print("--------------------------------------------------------------")
-
-    current_prices: Dict[str, Optional[float]] = {}
-
-    for coin in coins:
-        coin_data = data.get(coin, {})
-        price = coin_data.get("usd")
-        current_prices[coin] = price
-
-        prev_price = prev.get(coin)
-        if price is None or prev_price is None:
-            pct_change = None
-        else:
-            pct_change = ((price - prev_price) / prev_price) if prev_price != 0 else None
-
-        if price is None:
+    prev: List[float],
+    header: str,
+) -> List[float]:
+    """
+    Print table and return current prices to be used as previous next poll.
+    One row per (coin, quote currency) pair; `names` (already padded to NAME_WIDTH) and `price_formats`
+    are the precomputed row label and price format string (see price_format()); `header` comes from build_header().
+    Prices are plain lists aligned to `pairs` (same order as `prev`), with NaN marking a missing price.
+    The whole table is assembled first and emitted with a single write.
+    """
+    nan = math.nan
+    current_prices: List[float] = []
+    for coin, vs in pairs:
+        # a missing key and a JSON null both mean "no price"
+        price = data.get(coin, {}).get(vs)
+        current_prices.append(nan if price is None else float(price))
+
+    # NaN propagates through the division and fails the `> 0` test, so missing prices yield NaN
+    pct_changes = [(cur - old) / old if old > 0 else nan for cur, old in zip(current_prices, prev)]
+
+    lines = [SEPARATOR, header, SEPARATOR]
+    row_format = ROW_FORMAT + Style.RESET_ALL
+    for name, price_fmt, price, pct_change in zip(names, price_formats, current_prices, pct_changes):
+        # a missing price always has a NaN change too, so the two columns can be formatted independently
+        if math.isnan(price):
             price_str = Fore.YELLOW + "N/A"
-            pct_str = Fore.YELLOW + format_pct(pct_change)
         else:
-            price_str = (Fore.GREEN if price > 1 else Fore.RED) + format_price(price)
-            if pct_change is None:
-                pct_str = Fore.YELLOW + format_pct(pct_change)
-            else:
-                pct_str = (Fore.GREEN if pct_change > 0 else Fore.RED if pct_change < 0 else Fore.CYAN) + format_pct(pct_change)
+            price_str = (Fore.GREEN if price > 1 else Fore.RED) + price_fmt.format(price)
+        if math.isnan(pct_change):
+            pct_str = Fore.YELLOW + "   N/A   "
+        else:
+            sign = "+" if pct_change >= 0 else ""
+            color = Fore.GREEN if pct_change > 0 else Fore.RED if pct_change < 0 else Fore.CYAN
+            pct_str = f"{color}{sign}{pct_change * 100:7.2f}%"
 
-        print(f"{coin.capitalize():<12}{price_str:>16}{pct_str:>14}")
+        lines.append(row_format.format_map({"name": name, "price": price_str, "pct": pct_str}))
 
-    print("--------------------------------------------------------------")
+    lines.append(SEPARATOR)
+    sys.stdout.write("\n".join(lines) + "\n")
     return current_prices
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Terminal crypto price tracker with CSV logging and percent-change.")
     parser.add_argument("--coins", "-c", help="Comma-separated coin ids or symbols (e.g. BTC,ETH or bitcoin,ethereum). Default: common set", default=",".join(DEFAULT_COINS))
+    parser.add_argument("--vs", help="Comma-separated quote currencies, fetched in one request (e.g. usd,eur,btc)", default=",".join(DEFAULT_VS))
     parser.add_argument("--interval", "-i", type=int, help="Refresh interval in seconds", default=DEFAULT_INTERVAL)
     parser.add_argument("--timeout", "-t", type=int, help="HTTP request timeout in seconds", default=DEFAULT_TIMEOUT)
     parser.add_argument("--csv", "-o", help="CSV file to append prices to (set empty to disable)", default=DEFAULT_CSV)
@@ -185,64 +359,108 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
 def main(argv: Optional[List[str]] = None) -> None:
     args = parse_args(argv)
 
-    if args.no_color:
+    # like colorama's autoreset wrapper, only emit escapes to a terminal (not files, pipes or the journal)
+    if args.no_color or not sys.stdout.isatty():
         global Fore, Style
         class _NoColor:
-            RED = GREEN = CYAN = MAGENTA = YELLOW = ""
+            RED = GREEN = CYAN = MAGENTA = YELLOW = BRIGHT = RESET_ALL = ""
         Fore = _NoColor()
         Style = _NoColor()
+    else:
+        enable_windows_ansi()
 
     # Resolve symbols/ids into CoinGecko ids
     resolved_coins, mapping = resolve_input_coins(args.coins)
     if not resolved_coins:
-        print(Fore.RED + "No coins specified. Exiting.")
+        print(Fore.RED + "No coins specified. Exiting." + Style.RESET_ALL)
+        sys.exit(1)
+    resolved_vs = resolve_vs_currencies(args.vs)
+    if not resolved_vs:
+        print(Fore.RED + "No quote currencies specified. Exiting." + Style.RESET_ALL)
         sys.exit(1)
 
     interval = max(1, args.interval)
     timeout = max(1, args.timeout)
     csv_path = "" if args.no_csv else (args.csv or "")
 
-    if csv_path:
-        ensure_csv_header(csv_path, resolved_coins)
-
     # Show how user inputs were resolved (helpful when using symbols)
     print("Resolved coin inputs:")
     for orig, cid in mapping.items():
         print(f"  {orig} -> {cid}")
-    print("Starting tracker for:", ", ".join(resolved_coins))
+    print("Starting tracker for:", ", ".join(resolved_coins), "in", ", ".join(v.upper() for v in resolved_vs))
     print()
 
-    prev_prices: Dict[str, float] = {}
+    # The coin/currency lists are fixed from here on: build request URLs, header and row labels once
+    urls = build_batch_urls(resolved_coins, resolved_vs)
+    header = build_header(resolved_vs)
+    pairs = [(c, vs) for c in resolved_coins for vs in resolved_vs]
+    if len(resolved_vs) == 1:
+        names = [c.capitalize().ljust(NAME_WIDTH) for c, _ in pairs]
+    else:
+        # several rows per coin: label each with its quote currency so a missing (N/A) pair is identifiable;
+        # these labels are longer, so always keep one space before the price column
+        names = [f"{c.capitalize()}/{vs.upper()}".ljust(NAME_WIDTH - 1) + " " for c, vs in pairs]
+    price_formats = [price_format(vs) for _, vs in pairs]
+    prev_prices: List[float] = [math.nan] * len(pairs)
+
+    csv_file = open_csv_log(csv_path, pairs) if csv_path else None
+    rows_since_flush = 0
+
+    # SIGTERM (e.g. systemd/container stop) wakes the inter-poll wait immediately for a clean shutdown
+    stop_evt = threading.Event()
+    prev_sigterm = signal.signal(signal.SIGTERM, lambda *_: stop_evt.set())
 
     try:
+        # Polls are scheduled against a monotonic deadline so fetch/print time doesn't accumulate as drift
+        deadline = time.monotonic()
         while True:
             try:
-                data = fetch_prices(resolved_coins, timeout=timeout)
-                current_prices = print_prices(resolved_coins, data, prev_prices)
-
-                csv_row_prices: Dict[str, Optional[float]] = {c: current_prices.get(c) for c in resolved_coins}
-                if csv_path:
-                    append_prices_to_csv(csv_path, resolved_coins, csv_row_prices)
-
-                print(Fore.CYAN + f"Last updated: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+                data = fetch_prices(urls, timeout=timeout)
+                current_prices = print_prices(pairs, names, price_formats, data, prev_prices, header)
+                now_str = time.strftime("%Y-%m-%d %H:%M:%S")
+
+                if csv_file is not None:
+                    append_prices_to_csv(csv_file, current_prices, now_str=now_str)
+                    rows_since_flush += 1
+                    if rows_since_flush >= CSV_FLUSH_EVERY:
+                        csv_file.flush()
+                        rows_since_flush = 0
+
+                print(Fore.CYAN + f"Last updated: {now_str}" + Style.RESET_ALL)
                 if args.once:
                     break
-                print(Fore.MAGENTA + f"Next update in {interval} seconds...")
-                prev_prices = {k: v for k, v in current_prices.items() if v is not None}
-                time.sleep(interval)
+                print(Fore.MAGENTA + f"Next update in {interval} seconds..." + Style.RESET_ALL)
+                prev_prices = current_prices
 
             except requests.RequestException as e:
-                print(Fore.RED + "Network/API error: " + str(e))
-                print(Fore.MAGENTA + f"Retrying in {interval} seconds...")
-                time.sleep(interval)
+                print(Fore.RED + "Network/API error: " + str(e) + Style.RESET_ALL)
+                print(Fore.MAGENTA + f"Retrying in {interval} seconds..." + Style.RESET_ALL)
             except Exception as e:
-                print(Fore.RED + "Unexpected error: " + str(e))
-                print(Fore.MAGENTA + f"Retrying in {interval} seconds...")
-                time.sleep(interval)
+                print(Fore.RED + "Unexpected error: " + str(e) + Style.RESET_ALL)
+                print(Fore.MAGENTA + f"Retrying in {interval} seconds..." + Style.RESET_ALL)
+
+            deadline += interval
+            if deadline <= time.monotonic():
+                # the poll overran the interval: start the next one now and re-anchor instead of bursting to catch up
+                deadline = time.monotonic()
+            # Wait in short slices: a long timed Event.wait can't be interrupted by Ctrl+C on Windows
+            while not stop_evt.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                stop_evt.wait(min(remaining, WAIT_SLICE))
+            if stop_evt.is_set():
+                print(Style.BRIGHT + "\nExiting (terminated). Goodbye!" + Style.RESET_ALL)
+                break
 
     except KeyboardInterrupt:
-        print(Style.BRIGHT + "\nExiting (keyboard interrupt). Goodbye!")
+        print(Style.BRIGHT + "\nExiting (keyboard interrupt). Goodbye!" + Style.RESET_ALL)
         sys.exit(0)
+    finally:
+        # main() may be called as a function: don't leave our handler installed in the host process
+        signal.signal(signal.SIGTERM, prev_sigterm)
+        if csv_file is not None:
+            csv_file.close()
 
 
 if __name__ == "__main__":